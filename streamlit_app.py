@@ -1,19 +1,21 @@
+import hmac
 import os
-from typing import Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
-import requests
+import httpx
+import orjson
 import streamlit as st
 from dotenv import load_dotenv
 import re
 import csv
+from html import escape
 import time
 import uuid
 from pathlib import Path
 from datetime import datetime, timedelta
 
-# Load .env if present
-load_dotenv()
-
 # ---- App Config ----
 st.set_page_config(
     page_title="YouTube 인기 동영상",
@@ -21,6 +23,19 @@ st.set_page_config(
     layout="wide",
 )
 
+
+@st.cache_resource(show_spinner=False)
+def load_env_file() -> None:
+    """Load .env (if present) once per process; edits to it take effect after a restart.
+
+    Secrets are still read on every rerun (cheap lookups), so creating or editing
+    secrets.toml is picked up without restarting the app.
+    """
+    load_dotenv()
+
+
+load_env_file()
+
 # Rerun helper for Streamlit versions (st.rerun preferred, fallback to experimental)
 def _rerun():
     try:
@@ -44,6 +59,29 @@ if "role" not in st.session_state:
 if "user_name" not in st.session_state:
     st.session_state.user_name = None
 
+# Brute-force throttling: each failure sleeps a little longer, and too many lock the form
+MAX_LOGIN_ATTEMPTS = 10
+LOGIN_LOCKOUT_SEC = 60
+
+
+def _login_locked_for() -> int:
+    """Seconds left on the current login lockout (0 if not locked)."""
+    return max(0, int((st.session_state.get("_login_locked_until") or 0) - time.time()))
+
+
+def _register_login_failure():
+    attempts = st.session_state.get("_login_attempts", 0) + 1
+    st.session_state._login_attempts = attempts
+    time.sleep(min(2.0, 0.25 * attempts))
+    if attempts >= MAX_LOGIN_ATTEMPTS:
+        st.session_state._login_attempts = 0
+        st.session_state._login_locked_until = time.time() + LOGIN_LOCKOUT_SEC
+
+
+def _login_lockout_error():
+    st.error(f"로그인 시도가 너무 많습니다. {_login_locked_for()}초 후 다시 시도하세요.")
+
+
 def login_view():
     st.title("로그인")
     st.caption("인증 후 인기 동영상 대시보드가 표시됩니다.")
@@ -58,17 +96,21 @@ def login_view():
             pw = st.text_input("Password", value="", type="password", placeholder="예) YTB001")
             submitted_g = st.form_submit_button("로그인")
             if submitted_g:
+                if _login_locked_for():
+                    _login_lockout_error()
                 # Validate name
-                if not name.strip():
+                elif not name.strip():
                     st.error("성명을 입력하세요.")
                 else:
                     # Validate password pattern YTB001..YTB100
                     m = re.fullmatch(r"YTB(\d{3})", pw.strip())
                     if not m:
+                        _register_login_failure()
                         st.error("Password 형식이 올바르지 않습니다. 예) YTB001 ~ YTB100")
                     else:
                         n = int(m.group(1))
                         if 1 <= n <= 100:
+                            st.session_state._login_attempts = 0
                             st.session_state.authenticated = True
                             st.session_state.role = "general"
                             st.session_state.user_name = name.strip()
@@ -78,6 +120,7 @@ def login_view():
                             st.success("로그인 성공! 잠시만 기다려주세요…")
                             _rerun()
                         else:
+                            _register_login_failure()
                             st.error("Password 범위는 YTB001 ~ YTB100 입니다.")
 
     with tab_admin:
@@ -93,13 +136,18 @@ def login_view():
                 cfg_pw = (ADMIN_PW or "")
                 if not cfg_id or not cfg_pw:
                     st.error("관리자 자격 정보가 설정되지 않았습니다. secrets.toml 또는 .env에 ADMIN_ID/ADMIN_PASSWORD를 설정하세요.")
-                elif uid == cfg_id and upw == cfg_pw:
+                elif _login_locked_for():
+                    _login_lockout_error()
+                # Constant-time comparison; `&` so both are always evaluated
+                elif hmac.compare_digest(uid.encode(), cfg_id.encode()) & hmac.compare_digest(upw.encode(), cfg_pw.encode()):
+                    st.session_state._login_attempts = 0
                     st.session_state.authenticated = True
                     st.session_state.role = "admin"
                     st.session_state.user_name = uid
                     st.success("로그인 성공! 잠시만 기다려주세요…")
                     _rerun()
                 else:
+                    _register_login_failure()
                     st.error("ID 또는 Password가 올바르지 않습니다.")
 
 # Gate: show login until authenticated
@@ -114,6 +162,47 @@ except Exception:
     API_KEY = None
 DEFAULT_REGION = "KR"  # Change to your preference
 MAX_RESULTS = 30
+# Always request a full page (same quota cost) so cache keys don't depend on the display count
+API_MAX_RESULTS = 50
+PAGE_SIZE = 10  # cards rendered per "더보기" step
+# Cache TTL (seconds) per endpoint: the mostPopular chart turns over on the order of hours
+CACHE_POLICIES = {"popular": 600, "channels": 300}
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+HTTP_HEADERS = {"User-Agent": "streamlit-youtube-analysis/1.0"}
+CHANNELS_URL = "https://www.googleapis.com/youtube/v3/channels"
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_client() -> httpx.Client:
+    """Shared HTTP/2 client for googleapis.com.
+
+    Kept in cache_resource because the script body re-runs on every interaction;
+    a module-level client would be rebuilt (and its connection lost) each time.
+    Over HTTP/2 the videos and channels requests share a single connection.
+    """
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=2,  # connection errors only; status retries live in api_get
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+    )
+    return httpx.Client(
+        transport=transport,
+        headers=HTTP_HEADERS,
+        timeout=15.0,
+    )
+
+
+def api_get(url: str, params: Dict) -> httpx.Response:
+    """GET with up to two retries on 429/5xx; the last response is returned as-is."""
+    client = get_http_client()
+    for attempt in range(3):
+        resp = client.get(url, params=params)
+        if resp.status_code not in RETRY_STATUSES or attempt == 2:
+            return resp
+        time.sleep(0.2 * 2 ** attempt)
+    return resp
 
 
 def format_views(n: Optional[str]) -> str:
@@ -123,6 +212,48 @@ def format_views(n: Optional[str]) -> str:
         return "-"
 
 
+CARD_CSS = (
+    "<style>"
+    ".yt-card{display:flex;gap:1rem;align-items:flex-start;padding:0.75rem 0;"
+    "border-bottom:1px solid rgba(128,128,128,0.3)}"
+    ".yt-card img,.yt-card .yt-no-thumb{width:160px;flex-shrink:0;border-radius:6px}"
+    ".yt-card .yt-no-thumb{color:gray}"
+    ".yt-card .yt-meta{margin-top:0.25rem}"
+    "</style>"
+)
+
+
+def render_card_html(idx: int, v: Dict, views: str, likes: str, subs: str) -> str:
+    """One video card as a single-line HTML snippet (no blank lines, so markdown leaves it alone)."""
+    thumb_url = v.get("thumbnail_url")
+    if thumb_url:
+        thumb = f'<img src="{escape(thumb_url)}" loading="lazy" alt="">'
+    else:
+        thumb = '<div class="yt-no-thumb">미리보기 없음</div>'
+    title = escape(v.get("title") or "(제목 없음)")
+    url = escape(v.get("url") or "#")
+    channel = escape(v.get("channel_title") or "-")
+    return (
+        f'<div class="yt-card">{thumb}<div>'
+        f'<a href="{url}" target="_blank"><b>{idx}. {title}</b></a>'
+        f'<div class="yt-meta">채널: {channel}<br>조회수: {views} · 좋아요: {likes} · 구독자: {subs}명</div>'
+        f"</div></div>"
+    )
+
+
+def build_cards_html(videos: List[Dict]) -> List[str]:
+    return [
+        render_card_html(
+            idx,
+            v,
+            format_views(v.get("view_count")),
+            format_views(v.get("like_count")),
+            format_views(v.get("subscriber_count")),
+        )
+        for idx, v in enumerate(videos, start=1)
+    ]
+
+
 def fetch_popular_videos(api_key: str, region: str, max_results: int) -> List[Dict]:
     """Fetch most popular videos using YouTube Data API v3.
 
@@ -135,19 +266,21 @@ def fetch_popular_videos(api_key: str, region: str, max_results: int) -> List[Di
         "chart": "mostPopular",
         "regionCode": region,
         "maxResults": max_results,
+        # Partial response: only the fields read below
+        "fields": "items(id,snippet(title,channelTitle,channelId,thumbnails),statistics(viewCount,likeCount))",
         "key": api_key,
     }
 
-    resp = requests.get(url, params=params, timeout=15)
-    if not resp.ok:
+    resp = api_get(url, params)
+    if not resp.is_success:
         # Try to extract error message
         try:
-            err = resp.json().get("error", {}).get("message", resp.text)
+            err = orjson.loads(resp.content).get("error", {}).get("message", resp.text)
         except Exception:
             err = resp.text
         raise RuntimeError(f"YouTube API 오류: {resp.status_code} - {err}")
 
-    data = resp.json()
+    data = orjson.loads(resp.content)
     items = data.get("items", [])
     results = []
     for it in items:
@@ -155,12 +288,12 @@ def fetch_popular_videos(api_key: str, region: str, max_results: int) -> List[Di
         sn = it.get("snippet", {})
         stt = it.get("statistics", {})
         thumbs = sn.get("thumbnails", {})
-        # pick a decent thumbnail available
+        # pick the smallest thumbnail that still fills the card column (medium = 320x180)
         thumb = (
-            thumbs.get("maxres")
-            or thumbs.get("standard")
+            thumbs.get("medium")
             or thumbs.get("high")
-            or thumbs.get("medium")
+            or thumbs.get("standard")
+            or thumbs.get("maxres")
             or thumbs.get("default")
             or {}
         )
@@ -179,29 +312,20 @@ def fetch_popular_videos(api_key: str, region: str, max_results: int) -> List[Di
     return results
 
 
-def fetch_channel_subscribers(api_key: str, channel_ids: List[str]) -> Dict[str, Optional[str]]:
-    """Fetch subscriberCount for given channel IDs. Returns {channel_id: subscriberCount(str or None)}.
-    Batches into a single request (max 50 IDs supported by API).
-    """
-    # Clean and limit size defensively
-    ids = [cid for cid in channel_ids if cid]
-    if not ids:
-        return {}
-    url = "https://www.googleapis.com/youtube/v3/channels"
-    params = {
+def _channel_batch_params(api_key: str, batch: Sequence[str]) -> Dict:
+    return {
         "part": "statistics",
-        "id": ",".join(ids[:50]),
+        "id": ",".join(batch),
+        "fields": "items(id,statistics/subscriberCount)",
         "key": api_key,
     }
-    resp = requests.get(url, params=params, timeout=15)
-    if not resp.ok:
-        try:
-            err = resp.json().get("error", {}).get("message", resp.text)
-        except Exception:
-            err = resp.text
+
+
+def _parse_channel_batch(resp: httpx.Response) -> Dict[str, Optional[str]]:
+    if not resp.is_success:
         # Return empty mapping on error to avoid breaking main list
         return {}
-    data = resp.json()
+    data = orjson.loads(resp.content)
     out: Dict[str, Optional[str]] = {}
     for it in data.get("items", []):
         cid = it.get("id")
@@ -210,15 +334,89 @@ def fetch_channel_subscribers(api_key: str, channel_ids: List[str]) -> Dict[str,
     return out
 
 
-@st.cache_data(show_spinner=True, ttl=300)
+def fetch_channel_subscribers(api_key: str, channel_ids: Sequence[str]) -> Dict[str, Optional[str]]:
+    """Fetch subscriberCount for given unique channel IDs. Returns {channel_id: subscriberCount(str or None)}.
+    The API accepts at most 50 IDs per request; a page of API_MAX_RESULTS videos always fits in one.
+    """
+    if not channel_ids:
+        return {}
+    out: Dict[str, Optional[str]] = {}
+    for i in range(0, len(channel_ids), 50):
+        out.update(_parse_channel_batch(api_get(CHANNELS_URL, _channel_batch_params(api_key, channel_ids[i:i + 50]))))
+    return out
+
+
+@st.cache_resource(show_spinner=False)
+def get_last_good_store() -> Dict[tuple, tuple]:
+    """Process-wide {(region, max_results): (fetched_at, videos)} of the last successful fetch.
+
+    Used as a stale fallback when the YouTube API is unavailable.
+    """
+    return {}
+
+
+@st.cache_resource(show_spinner=False)
+def get_cache_stats() -> Tuple[threading.Lock, Dict[str, Dict[str, float]]]:
+    """Process-wide {function name: {"calls", "misses", "miss_seconds"}} for the cached fetchers.
+
+    cache_data is shared by all sessions, so the counters are too; the lock guards
+    concurrent updates from session threads.
+    """
+    return threading.Lock(), {}
+
+
+def record_cache_stat(name: str, **increments: float) -> None:
+    lock, stats = get_cache_stats()
+    with lock:
+        entry = stats.setdefault(name, {"calls": 0, "misses": 0, "miss_seconds": 0.0})
+        for field, amount in increments.items():
+            entry[field] += amount
+
+
+@contextmanager
+def track_cache_miss(name: str) -> Iterator[None]:
+    """Wrap the body of a cached function: it only runs on a cache miss."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_cache_stat(name, misses=1, miss_seconds=time.perf_counter() - start)
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_POLICIES["popular"], max_entries=32)
 def get_popular_cached(api_key: str, region: str, max_results: int) -> List[Dict]:
-    return fetch_popular_videos(api_key, region, max_results)
+    with track_cache_miss("get_popular_cached"):
+        results = fetch_popular_videos(api_key, region, max_results)
+    get_last_good_store()[(region, max_results)] = (time.time(), results)
+    return results
+
 
+@st.cache_data(show_spinner=False, ttl=CACHE_POLICIES["channels"], max_entries=64)
+def get_channel_subscribers_cached(api_key: str, channel_ids: Tuple[str, ...]) -> Dict[str, Optional[str]]:
+    # channel_ids must be a sorted, de-duplicated tuple so the cache key is order-independent
+    with track_cache_miss("get_channel_subscribers_cached"):
+        return fetch_channel_subscribers(api_key, channel_ids)
+
+
+REGION_OPTIONS = (
+    ("KR", "대한민국"),
+    ("US", "미국"),
+    ("JP", "일본"),
+    ("GB", "영국"),
+    ("DE", "독일"),
+    ("FR", "프랑스"),
+    ("IN", "인도"),
+    ("BR", "브라질"),
+    ("CA", "캐나다"),
+    ("AU", "호주"),
+)
 
-@st.cache_data(show_spinner=False, ttl=300)
-def get_channel_subscribers_cached(api_key: str, channel_ids_tuple: tuple) -> Dict[str, Optional[str]]:
-    # channel_ids_tuple is hashable for cache; convert back to list
-    return fetch_channel_subscribers(api_key, list(channel_ids_tuple))
+
+@st.cache_resource(show_spinner=False)
+def _region_tables() -> Tuple[Tuple[str, ...], Dict[str, str]]:
+    """Selectbox labels ("대한민국 (KR)") and a label -> region code map, built once per process."""
+    labels = tuple(f"{name} ({code})" for code, name in REGION_OPTIONS)
+    return labels, {label: code for label, (code, _) in zip(labels, REGION_OPTIONS)}
 
 
 # ---- UI ----
@@ -227,27 +425,15 @@ st.caption("간단한 Streamlit 앱 • 지역별 인기 영상 • 새로고침
 
 with st.sidebar:
     st.subheader("설정")
-    countries = [
-        ("KR", "대한민국"),
-        ("US", "미국"),
-        ("JP", "일본"),
-        ("GB", "영국"),
-        ("DE", "독일"),
-        ("FR", "프랑스"),
-        ("IN", "인도"),
-        ("BR", "브라질"),
-        ("CA", "캐나다"),
-        ("AU", "호주"),
-    ]
-    display_options = [f"{name} ({code})" for code, name in countries]
+    display_options, region_by_label = _region_tables()
     selected_display = st.selectbox(
         "지역 코드 (국가명)",
         options=display_options,
         index=0,
         help="YouTube 인기 동영상을 조회할 국가 코드",
     )
-    # Extract the code from the selected label: e.g., "대한민국 (KR)" -> KR
-    region = selected_display.split("(")[-1].rstrip(")")
+    # Map the selected label back to its code: e.g., "대한민국 (KR)" -> KR
+    region = region_by_label[selected_display]
     refresh = st.button("🔄 새로고침")
     st.divider()
     # User info
@@ -307,81 +493,114 @@ if not API_KEY or (isinstance(API_KEY, str) and not API_KEY.strip()):
     )
     st.stop()
 
-# Handle manual refresh by clearing cache
+# Handle manual refresh by clearing the video list cache (subscriber counts expire on their own TTL)
 if refresh:
     get_popular_cached.clear()
-    get_channel_subscribers_cached.clear()
 
 try:
     with st.spinner("인기 동영상 불러오는 중..."):
-        videos = get_popular_cached(API_KEY, region, MAX_RESULTS)
-        # Fetch channel subscriber counts in batch
-        channel_ids = sorted({v.get("channel_id") for v in videos if v.get("channel_id")})
-        subs_map = get_channel_subscribers_cached(API_KEY, tuple(channel_ids)) if channel_ids else {}
-        for v in videos:
-            v["subscriber_count"] = subs_map.get(v.get("channel_id"))
+        record_cache_stat("get_popular_cached", calls=1)
+        videos = get_popular_cached(API_KEY, region, API_MAX_RESULTS)
 except Exception as e:
-    st.error(f"데이터를 불러오는 중 오류가 발생했습니다: {e}")
-    st.stop()
+    # Serve the last successful result (if any) instead of failing the whole page
+    stale = get_last_good_store().get((region, API_MAX_RESULTS))
+    if not stale:
+        st.error(f"데이터를 불러오는 중 오류가 발생했습니다: {e}")
+        st.stop()
+    fetched_at, stale_videos = stale
+    videos = [dict(v) for v in stale_videos]
+    st.warning(f"YouTube API 호출에 실패하여 {int(time.time() - fetched_at)}초 전에 받아온 결과를 표시합니다. ({e})")
+
+# Fetch channel subscriber counts in batch; missing counts are shown as "-"
+try:
+    unique_channel_ids = tuple(sorted({v.get("channel_id") for v in videos if v.get("channel_id")}))
+    subs_map = {}
+    if unique_channel_ids:
+        record_cache_stat("get_channel_subscribers_cached", calls=1)
+        subs_map = get_channel_subscribers_cached(API_KEY, unique_channel_ids)
+except Exception:
+    subs_map = {}
+videos = videos[:MAX_RESULTS]
+for v in videos:
+    v["subscriber_count"] = subs_map.get(v.get("channel_id"))
 
 if not videos:
     st.warning("표시할 동영상이 없습니다.")
     st.stop()
 
 # ---- List rendering ----
-for idx, v in enumerate(videos, start=1):
-    cols = st.columns([1, 5])
-    with cols[0]:
-        if v.get("thumbnail_url"):
-            st.image(v["thumbnail_url"], use_container_width=True)
-        else:
-            st.write(":grey[미리보기 없음]")
-    with cols[1]:
+# Only the first visible_count cards are rendered; reset paging when the region changes
+if st.session_state.get("visible_region") != region:
+    st.session_state.visible_region = region
+    st.session_state.visible_count = PAGE_SIZE
+
+
+def _show_more():
+    st.session_state.visible_count += PAGE_SIZE
+
+
+visible_videos = videos[:st.session_state.visible_count]
+cards_html = build_cards_html(visible_videos)
+if st.session_state.get("role") != "general":
+    # No per-card widgets needed: ship the whole list as one markdown element
+    st.markdown(CARD_CSS + "".join(cards_html), unsafe_allow_html=True)
+else:
+    st.markdown(CARD_CSS, unsafe_allow_html=True)
+    for v, card_html in zip(visible_videos, cards_html):
+        st.markdown(card_html, unsafe_allow_html=True)
         title = v.get("title") or "(제목 없음)"
         url = v.get("url") or "#"
-        st.markdown(f"**{idx}. [" + title.replace("(", "\\(").replace(")", "\\)") + f"]({url})**")
-        st.write(f"채널: {v.get('channel_title') or '-'}")
-        # 조회수, 좋아요, 구독자 표시
-        views = format_views(v.get("view_count"))
-        likes = format_views(v.get("like_count"))
-        subs = format_views(v.get("subscriber_count"))
-        st.write(f"조회수: {views} · 좋아요: {likes} · 구독자: {subs}명")
         # Click logging button for general users
-        if st.session_state.get("authenticated") and st.session_state.get("role") == "general" and url != "#":
-            if st.button("보기", key=f"open_{v.get('id')}"):
-                try:
-                    logs_dir = Path("logs")
-                    logs_dir.mkdir(exist_ok=True)
-                    clicks_csv = logs_dir / "clicks.csv"
-                    visit_id = st.session_state.get("visit_id") or str(uuid.uuid4())
-                    if not st.session_state.get("visit_id"):
-                        st.session_state.visit_id = visit_id
-                    user = st.session_state.get("user_name") or "(unknown)"
-                    row = {
-                        "visit_id": visit_id,
-                        "user_name": user,
-                        "timestamp": datetime.now().isoformat(timespec="seconds"),
-                        "video_id": v.get("id"),
-                        "title": title,
-                        "channel_title": v.get("channel_title"),
-                        "url": url,
-                    }
-                    write_header = not clicks_csv.exists()
-                    with clicks_csv.open("a", newline="", encoding="utf-8") as f:
-                        writer = csv.DictWriter(f, fieldnames=list(row.keys()))
-                        if write_header:
-                            writer.writeheader()
-                        writer.writerow(row)
-                    st.success("클릭이 기록되었습니다. 아래 링크를 눌러 새 탭에서 열 수 있습니다.")
-                    st.markdown(f"[새 탭에서 열기]({url})")
-                except Exception as _:
-                    st.warning("클릭 기록 중 문제가 발생했습니다. 링크를 직접 클릭해 주세요.")
-    st.divider()
+        if url != "#" and st.button("보기", key=f"open_{v.get('id')}"):
+            try:
+                logs_dir = Path("logs")
+                logs_dir.mkdir(exist_ok=True)
+                clicks_csv = logs_dir / "clicks.csv"
+                visit_id = st.session_state.get("visit_id") or str(uuid.uuid4())
+                if not st.session_state.get("visit_id"):
+                    st.session_state.visit_id = visit_id
+                user = st.session_state.get("user_name") or "(unknown)"
+                row = {
+                    "visit_id": visit_id,
+                    "user_name": user,
+                    "timestamp": datetime.now().isoformat(timespec="seconds"),
+                    "video_id": v.get("id"),
+                    "title": title,
+                    "channel_title": v.get("channel_title"),
+                    "url": url,
+                }
+                write_header = not clicks_csv.exists()
+                with clicks_csv.open("a", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+                    if write_header:
+                        writer.writeheader()
+                    writer.writerow(row)
+                st.success("클릭이 기록되었습니다. 아래 링크를 눌러 새 탭에서 열 수 있습니다.")
+                st.markdown(f"[새 탭에서 열기]({url})")
+            except Exception as _:
+                st.warning("클릭 기록 중 문제가 발생했습니다. 링크를 직접 클릭해 주세요.")
+
+if len(videos) > len(visible_videos):
+    st.button(f"더보기 ({len(visible_videos)}/{len(videos)})", on_click=_show_more)
 
 st.success("완료! 최신 인기 동영상이 표시되었습니다.")
 
 # ---- Admin Dashboard: 방문 이력/클릭 요약 ----
 if st.session_state.get("authenticated") and st.session_state.get("role") == "admin":
+    # Cache hit/miss counters (process-wide) to help tune CACHE_POLICIES
+    with st.sidebar.expander("캐시 통계"):
+        lock, stats = get_cache_stats()
+        with lock:
+            snapshot = {name: dict(entry) for name, entry in stats.items()}
+        if not snapshot:
+            st.caption("아직 기록된 호출이 없습니다.")
+        for name, entry in snapshot.items():
+            calls = int(entry["calls"])
+            misses = int(entry["misses"])
+            hit_rate = (calls - misses) / calls * 100 if calls else 0.0
+            avg_ms = entry["miss_seconds"] / misses * 1000 if misses else 0.0
+            st.caption(f"{name}: 호출 {calls} · 미스 {misses} · 적중률 {hit_rate:.0f}% · 미스 평균 {avg_ms:.0f}ms")
+
     st.header("관리자 대시보드 : 일반인 방문 이력")
     logs_dir = Path("logs")
     visits_csv = logs_dir / "visits.csv"